@@ -1,9 +1,12 @@
 import argparse
-from dataclasses import dataclass
+import importlib
+import importlib.util
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-from constants import NETID
+from constants import DEFAULT_ENGINE, NETID
+from core import ENGINES
 
 
 @dataclass
@@ -15,6 +18,60 @@ class Args:
     debug: bool = False
     iodir: Path = Path("./input/")
     output_dir: Optional[Path] = None
+    breakpoints: list[int] = field(default_factory=list)
+    mem_watches: list[tuple[int, int]] = field(default_factory=list)
+    reg_watches: list[int] = field(default_factory=list)
+    hooks: list[Callable] = field(default_factory=list)
+    halt_on_break: bool = False
+    timing: Optional[Path] = None
+    mem_trace: bool = False
+    max_cycles: Optional[int] = None
+    cycle_dumps: bool = True
+    detect_loops: bool = False
+    engines: list[str] = field(default_factory=lambda: [DEFAULT_ENGINE])
+
+
+def parse_int(text: str) -> int:
+    """Accept decimal or prefixed (0x/0b) integers on the command line."""
+    return int(text, 0)
+
+
+def positive_int(text: str) -> int:
+    """Integer argument that must be at least 1."""
+    value = parse_int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {text}")
+    return value
+
+
+def parse_range(text: str) -> tuple[int, int]:
+    """Parse `START:END` (end exclusive) or a single word address `ADDR`."""
+    if ":" in text:
+        start, end = text.split(":", 1)
+        return parse_int(start), parse_int(end)
+    start = parse_int(text)
+    return start, start + 4
+
+
+def load_hook(text: str) -> Callable:
+    """Resolve `MODULE:FUNCTION`; MODULE is an importable name or a path to a .py file."""
+    module_name, sep, func_name = text.rpartition(":")
+    if not sep or not module_name or not func_name:
+        raise argparse.ArgumentTypeError(f"expected MODULE:FUNCTION, got {text}")
+    try:
+        if module_name.endswith(".py"):
+            path = Path(module_name).resolve()
+            spec = importlib.util.spec_from_file_location(path.stem, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        else:
+            module = importlib.import_module(module_name)
+        hook = getattr(module, func_name)
+    except (ImportError, OSError, AttributeError) as exc:
+        raise argparse.ArgumentTypeError(f"cannot load hook {text}: {exc}")
+    if not callable(hook):
+        raise argparse.ArgumentTypeError(f"hook {text} is not callable")
+    return hook
 
 
 def get_args() -> Args:
@@ -26,9 +83,45 @@ def get_args() -> Args:
     parser = argparse.ArgumentParser()
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
     parser.add_argument("--iodir", type=Path, default=Path("./input/"), help="Input directory")
+    parser.add_argument("--break", dest="breakpoints", type=parse_int, action="append", default=[],
+                        help="Record a PC breakpoint (implies --debug, repeatable)")
+    parser.add_argument("--watch-mem", dest="mem_watches", type=parse_range, action="append", default=[],
+                        help="Watch data memory START:END or a word ADDR (implies --debug, repeatable)")
+    parser.add_argument("--watch-reg", dest="reg_watches", type=int, action="append", default=[],
+                        help="Watch a register for changes (implies --debug, repeatable)")
+    parser.add_argument("--hook", dest="hooks", type=load_hook, action="append", default=[],
+                        help="Record a hit whenever MODULE:FUNCTION(core) is true before a step (implies --debug, repeatable)")
+    parser.add_argument("--halt-on-break", action="store_true", help="Stop the run at the first debug event (implies --debug)")
+    parser.add_argument("--timing", type=Path, default=None,
+                        help="TOML/JSON latency model; adds a cycle breakdown to the metrics")
+    parser.add_argument("--mem-trace", action="store_true",
+                        help="Record data-memory accesses to a binary trace per case")
+    parser.add_argument("--max-cycles", type=positive_int, default=None,
+                        help="Stop a case after this many charged cycles (see --timing) if it has not halted")
+    parser.add_argument("--detect-loops", action="store_true",
+                        help="Stop a case once it revisits an identical architectural state")
+    parser.add_argument("--no-cycle-dumps", dest="cycle_dumps", action="store_false",
+                        help="Only write the final RF/state instead of one block per cycle")
+    parser.add_argument("--engine", dest="engines", choices=sorted(ENGINES), action="append", default=None,
+                        help="Execution engine; repeat to run and time several engines per case")
     ns = parser.parse_args()
 
-    cfg = Args(debug=ns.debug, iodir=ns.iodir)
+    probes = ns.breakpoints or ns.mem_watches or ns.reg_watches or ns.hooks or ns.halt_on_break
+    cfg = Args(
+        debug=ns.debug or bool(probes),
+        iodir=ns.iodir,
+        breakpoints=ns.breakpoints,
+        mem_watches=ns.mem_watches,
+        reg_watches=ns.reg_watches,
+        hooks=ns.hooks,
+        halt_on_break=ns.halt_on_break,
+        timing=ns.timing.resolve() if ns.timing else None,
+        mem_trace=ns.mem_trace,
+        max_cycles=ns.max_cycles,
+        cycle_dumps=ns.cycle_dumps,
+        detect_loops=ns.detect_loops,
+        engines=list(dict.fromkeys(ns.engines or [DEFAULT_ENGINE])),
+    )
 
     # Normalize input directory first
     cfg.iodir = cfg.iodir.resolve()
@@ -7,11 +7,15 @@ MemSize = 1000
 
 NETID = "bk3170"
 
+DEFAULT_ENGINE = "single-stage"
+
 IMEM_FILE = "imem.txt"
 DMEM_FILE = "dmem.txt"
 DMEM_RESULT_FILE = "DMEMResult.txt"
 RF_FILE = "RFresult.txt"
 PERFORMANCE_FILE = "PerformanceMetrics.txt"
+DEBUG_LOG_FILE = "DebugLog.txt"
+MEM_TRACE_FILE = "MemTrace.bin"
 
 SS_STATE_RESULT_FILE = "StateResult_SS.txt"
 
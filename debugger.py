@@ -0,0 +1,132 @@
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+from constants import DEBUG_LOG_FILE, WORD_LEN
+
+
+class DebugEvent(NamedTuple):
+    """A single breakpoint/watchpoint/hook hit recorded by the debugger.
+
+    `cycle` counts the cycles charged before the hit, as in `#Cycles`.
+    """
+
+    cycle: int
+    pc: int
+    kind: str
+    detail: str
+
+
+class Debugger(object):
+    """Breakpoints, watchpoints and hooks layered on top of a core.
+
+    Nothing is patched until `attach` is called, and only the entry points
+    needed by the registered probes are wrapped, so a core without a
+    debugger (or with an empty one) runs its normal methods untouched.
+    """
+
+    def __init__(self, halt_on_break: bool = False) -> None:
+        self.halt_on_break = halt_on_break
+        self.breakpoints: set[int] = set()
+        self.mem_watches: list[tuple[int, int]] = []
+        self.reg_watches: set[int] = set()
+        self.hooks: list[tuple[str, Callable]] = []
+        self.events: list[DebugEvent] = []
+        self.status: Optional[str] = None
+        self.core = None
+
+    # Registration API
+    def add_breakpoint(self, pc: int) -> None:
+        self.breakpoints.add(pc)
+
+    def add_mem_watch(self, start: int, end: Optional[int] = None) -> None:
+        """Watch the byte range [start, end); a single word by default."""
+        self.mem_watches.append((start, start + WORD_LEN if end is None else end))
+
+    def add_reg_watch(self, reg_addr: int) -> None:
+        self.reg_watches.add(reg_addr)
+
+    def add_hook(self, condition: Callable, name: Optional[str] = None) -> None:
+        """Register `condition(core) -> bool`, evaluated before every step."""
+        self.hooks.append((name or getattr(condition, "__name__", "hook"), condition))
+
+    def is_empty(self) -> bool:
+        return not (self.breakpoints or self.mem_watches or self.reg_watches or self.hooks)
+
+    # Wiring
+    def attach(self, core) -> None:
+        """Install wrappers on `core` for the probes that are registered."""
+        self.core = core
+        if not self.is_empty():
+            core.needs_single_step = True
+        if self.breakpoints or self.hooks:
+            core.step = self._wrap_step(core.step)
+        if self.mem_watches:
+            dmem = core.ext_dmem
+            dmem.load_word = self._wrap_load(dmem.load_word)
+            dmem.store_word = self._wrap_store(dmem.store_word)
+        if self.reg_watches:
+            core.myRF.write_reg = self._wrap_write_reg(core.myRF.read_reg, core.myRF.write_reg)
+
+    def record(self, kind: str, detail: str) -> None:
+        core = self.core
+        # charged cycles, matching #Cycles and --max-cycles under --timing
+        self.events.append(DebugEvent(core.monitor.total_cycles, core.nextState.IF['PC'], kind, detail))
+
+    def _stop(self) -> None:
+        if self.halt_on_break and not self.core.halted:
+            event = self.events[-1]
+            self.status = f"stopped by debugger at cycle {event.cycle}: {event.kind} {event.detail}"
+            self.core.halted = True
+
+    def _wrap_step(self, step: Callable) -> Callable:
+        def debug_step() -> None:
+            core = self.core
+            # the HALT drain step stays on the HALT's PC; probes already ran for it
+            if not core.nextState.IF['nop']:
+                pc = core.nextState.IF['PC']
+                if pc in self.breakpoints:
+                    self.record("break", f"PC={pc}")
+                    self._stop()
+                for name, condition in self.hooks:
+                    if condition(core):
+                        self.record("hook", name)
+                        self._stop()
+            if not core.halted:
+                step()
+        return debug_step
+
+    def _hits_watch(self, address: int) -> bool:
+        end = address + WORD_LEN
+        return any(lo < end and address < hi for lo, hi in self.mem_watches)
+
+    def _wrap_load(self, load_word: Callable) -> Callable:
+        def debug_load_word(read_address: int) -> int:
+            value = load_word(read_address)
+            if self._hits_watch(read_address):
+                self.record("mem-read", f"addr={read_address} value={value}")
+                self._stop()
+            return value
+        return debug_load_word
+
+    def _wrap_store(self, store_word: Callable) -> Callable:
+        def debug_store_word(address: int, write_data: int) -> None:
+            store_word(address, write_data)
+            if self._hits_watch(address):
+                self.record("mem-write", f"addr={address} value={write_data}")
+                self._stop()
+        return debug_store_word
+
+    def _wrap_write_reg(self, read_reg: Callable, write_reg: Callable) -> Callable:
+        def debug_write_reg(reg_addr: int, wrt_reg_data: int) -> None:
+            old = read_reg(reg_addr)
+            write_reg(reg_addr, wrt_reg_data)
+            if reg_addr in self.reg_watches and old != wrt_reg_data:
+                self.record("reg", f"x{reg_addr}: {old} -> {wrt_reg_data}")
+                self._stop()
+        return debug_write_reg
+
+    def write_log(self, out_dir: Path) -> None:
+        with open(out_dir / DEBUG_LOG_FILE, 'w') as fh:
+            fh.writelines(
+                f"cycle {e.cycle:>8} | PC {e.pc:>6} | {e.kind:<9} | {e.detail}\n" for e in self.events
+            )
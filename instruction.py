@@ -36,6 +36,9 @@ class DecodedInstruction:
         self.rd = None
         self.imm = None
         self.alu_op = None
+        # timing annotations filled in by the core's decode cache
+        self.latency = 1
+        self.exec_count = 0
 
     def __init__(self, instruction: str, endian: str = ENDIAN_TYPES.BIG):
         self.raw_instr = instruction
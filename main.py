@@ -37,8 +37,9 @@
 
 from copy import deepcopy
 from pathlib import Path
+from time import perf_counter
 
-from constants import (INSTR_TYPES, PERFORMANCE_FILE,
+from constants import (INSTR_TYPES, MEM_TRACE_FILE, PERFORMANCE_FILE,
                        RF_FILE, SS_STATE_RESULT_FILE, STAGES, WORD_LEN)
 
 from instruction import Instruction
@@ -48,21 +49,67 @@ from monitors import Monitor
 from state import StageManager, State
 
 from arg_utils import Args, get_args
-from core import SingleStageCore
-
-
-def execute_case(cfg: Args):
+from core import get_engine
+from debugger import Debugger
+from memtrace import MemTraceWriter
+from timing import TimingModel
+from watchdog import Watchdog
+
+
+def build_debugger(cfg: Args) -> Debugger:
+    dbg = Debugger(halt_on_break=cfg.halt_on_break)
+    for pc in cfg.breakpoints:
+        dbg.add_breakpoint(pc)
+    for start, end in cfg.mem_watches:
+        dbg.add_mem_watch(start, end)
+    for reg in cfg.reg_watches:
+        dbg.add_reg_watch(reg)
+    for hook in cfg.hooks:
+        dbg.add_hook(hook)
+    return dbg
+
+
+def execute_case(cfg: Args, engine: str) -> float:
+    """Run one case on `engine`, write its results, return wall time in seconds."""
     instr_mem = InsMem("InstrMemObj", cfg.iodir)
     data_mem = DataMem("DataMemObj", cfg.iodir, cfg.output_dir)
-    processor = SingleStageCore(cfg.output_dir, instr_mem, data_mem)
-
-    while not processor.halted:
-        processor.step()
-
-    data_mem.outputDataMem()
-    processor.myRF.outputRF(processor.cycle)
-    processor.printState(processor.nextState, processor.cycle)
-    processor.monitor.writePerformance(mode='w')
+    timing = TimingModel.from_file(cfg.timing) if cfg.timing else None
+    processor = get_engine(engine)(cfg.output_dir, instr_mem, data_mem, timing)
+    processor.per_cycle_dumps = cfg.cycle_dumps
+    debugger = build_debugger(cfg) if cfg.debug else None
+    if debugger is not None:
+        debugger.attach(processor)
+    tracer = MemTraceWriter(cfg.output_dir / MEM_TRACE_FILE) if cfg.mem_trace else None
+    if tracer is not None:
+        tracer.attach(processor)
+
+    # attached last so it also observes writes made through other wrappers
+    watchdog = Watchdog() if cfg.detect_loops else None
+    if watchdog is not None:
+        watchdog.attach(processor)
+
+    started = perf_counter()
+    try:
+        halted = processor.run(cfg.max_cycles)
+    finally:
+        # keep the records captured so far even if the run raised
+        if tracer is not None:
+            tracer.close()
+    elapsed = perf_counter() - started
+
+    if watchdog is not None and watchdog.status is not None:
+        processor.monitor.status = watchdog.status
+    elif debugger is not None and debugger.status is not None:
+        processor.monitor.status = debugger.status
+    elif not halted:
+        processor.monitor.status = f"stopped, cycle budget of {cfg.max_cycles} exhausted before HALT"
+    if processor.monitor.status is not None:
+        print(f"   ⚠️  {processor.monitor.status}")
+
+    if debugger is not None:
+        debugger.write_log(cfg.output_dir)
+    processor.write_results()
+    return elapsed
 
 
 if __name__ == "__main__":
@@ -74,12 +121,18 @@ if __name__ == "__main__":
             continue
 
         print(f"➡️  Executing scenario located at: {case_path}")
-        case_args = deepcopy(params)
-        case_args.iodir = case_path
-        case_args.output_dir = params.output_dir / case_path.name
-        case_args.output_dir.mkdir(parents=True, exist_ok=True)
-
-        execute_case(case_args)
+        for engine in params.engines:
+            case_args = deepcopy(params)
+            case_args.iodir = case_path
+            case_args.output_dir = params.output_dir / case_path.name
+            # keep engines from overwriting each other when comparing several
+            if len(params.engines) > 1:
+                case_args.output_dir /= engine
+            case_args.output_dir.mkdir(parents=True, exist_ok=True)
+
+            elapsed = execute_case(case_args, engine)
+            if len(params.engines) > 1:
+                print(f"   ⏱️  {engine}: {elapsed:.3f}s")
         print(f"✅ Completed processing: {case_path.name}\n")
 
     print("🎉 All simulations have finished successfully!")
@@ -1,6 +1,6 @@
 from pathlib import Path
-from constants import BYTE_LEN, DMEM_FILE, DMEM_RESULT_FILE, IMEM_FILE, WORD_LEN, MemSize
-from misc import signed_binary_str_to_int, signed_int_to_binary_str
+from constants import DMEM_FILE, DMEM_RESULT_FILE, IMEM_FILE, WORD_LEN, MemSize
+from misc import byte_strs_to_signed_int, signed_int_to_byte_strs
 
 class InstructionMemory(object):
     """Instruction memory abstraction backed by text files.
@@ -35,13 +35,12 @@ class DataMemory(object):
         self.data_bytes.extend(['00000000'] * (MemSize - len(self.data_bytes)))
 
     def load_word(self, read_address: int) -> int:
-        bits = ''.join(self.data_bytes[read_address:read_address + WORD_LEN])
-        return signed_binary_str_to_int(bits)
+        return byte_strs_to_signed_int(self.data_bytes, read_address)
 
     def store_word(self, address: int, write_data: int) -> None:
-        word_bits = signed_int_to_binary_str(write_data)
+        word_bytes = signed_int_to_byte_strs(write_data)
         for i in range(WORD_LEN):
-            self.data_bytes[address + i] = word_bits[BYTE_LEN * i:BYTE_LEN * (i + 1)]
+            self.data_bytes[address + i] = word_bytes[i]
 
     def dump_memory(self) -> None:
         res_path = self.out_dir / f'{self.mem_id}_{DMEM_RESULT_FILE}'
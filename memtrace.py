@@ -0,0 +1,60 @@
+import struct
+from pathlib import Path
+from typing import Callable
+
+# Fixed-width little-endian record: cycle (u64), PC (u32), address (u32), R/W (u8).
+# `trace_replay.py` mirrors this layout as a packed NumPy dtype.
+MEMTRACE_MAGIC = b"RVMTRC01"
+MEMTRACE_RECORD = struct.Struct("<QIIB")
+MEM_READ = 0
+MEM_WRITE = 1
+
+
+class MemTraceWriter(object):
+    """Streams every data-memory word access of a core to a binary file.
+
+    Records are packed into a preallocated `bytearray` and flushed to disk
+    only when it fills, so capture costs one `pack_into` per access.
+    """
+
+    def __init__(self, path: Path, capacity: int = 1 << 16) -> None:
+        self.path = path
+        self.buffer = bytearray(MEMTRACE_RECORD.size * capacity)
+        self.offset = 0
+        self.count = 0
+        self.core = None
+        self.fh = open(path, "wb")
+        self.fh.write(MEMTRACE_MAGIC)
+
+    def attach(self, core) -> None:
+        """Wrap the core's data memory so loads and stores are recorded."""
+        self.core = core
+        # records carry the cycle of each access, so no fused dispatch
+        core.needs_single_step = True
+        dmem = core.ext_dmem
+        dmem.load_word = self._wrap(dmem.load_word, MEM_READ)
+        dmem.store_word = self._wrap(dmem.store_word, MEM_WRITE)
+
+    def _wrap(self, access: Callable, kind: int) -> Callable:
+        pack_into = MEMTRACE_RECORD.pack_into
+        size = MEMTRACE_RECORD.size
+        buffer = self.buffer
+        writer = self
+
+        def traced_access(address: int, *args):
+            core = writer.core
+            pack_into(buffer, writer.offset, core.cycle, core.nextState.IF['PC'], address & 0xFFFFFFFF, kind)
+            writer.offset += size
+            writer.count += 1
+            if writer.offset == len(buffer):
+                writer.flush()
+            return access(address, *args)
+        return traced_access
+
+    def flush(self) -> None:
+        self.fh.write(memoryview(self.buffer)[:self.offset])
+        self.offset = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.fh.close()
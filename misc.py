@@ -1,11 +1,21 @@
 from functools import partial
-from typing import Optional
+from typing import Optional, Sequence
 
-from constants import SYS_BIT, BIAS, UPPER_BOUND
+from constants import BYTE_LEN, SYS_BIT, BIAS, UPPER_BOUND, WORD_LEN
 
 # curry int conversion for binary strings
 binary_str_to_int = partial(int, base=2)
 
+# precomputed byte <-> bitstring tables used by the serialization fast paths
+BYTE_TO_BITS: tuple[str, ...] = tuple(format(i, f"0{BYTE_LEN}b") for i in range(256))
+BITS_TO_BYTE: dict[str, int] = {bits: i for i, bits in enumerate(BYTE_TO_BITS)}
+
+# values in [LOWER_BOUND, BIAS) encode to exactly SYS_BIT bits without truncation
+LOWER_BOUND = -(UPPER_BOUND + 1)
+WORD_MASK = BIAS - 1
+_WORD_FORMAT = f"0{SYS_BIT}b"
+_WORD_SLICES = tuple(slice(BYTE_LEN * i, BYTE_LEN * (i + 1)) for i in range(WORD_LEN))
+
 
 def sign_ext(x: str, prefix: Optional[str] = None, length: int = SYS_BIT) -> str:
     """Extend x to a fixed bit width using the sign bit (or provided prefix).
@@ -24,12 +34,53 @@ def signed_binary_str_to_int(x: str) -> int:
     return (val - BIAS) if (val > UPPER_BOUND) else val
 
 
+def _legacy_signed_int_to_binary_str(x: int) -> str:
+    if x < 0:
+        x += BIAS
+        return format(x, "b")[:32]
+    return sign_ext(format(x, "b")[:32], prefix="0")
+
+
 def signed_int_to_binary_str(x: int) -> str:
     """Encode a Python int as a 32-bit two's complement binary string.
 
     The truncation behavior is retained to preserve output compatibility.
     """
-    if x < 0:
-        x += BIAS
-        return format(x, "b")[:32]
-    return sign_ext(format(x, "b")[:32], prefix="0")
+    if LOWER_BOUND <= x < BIAS:
+        b = (x & WORD_MASK).to_bytes(WORD_LEN, "big")
+        return BYTE_TO_BITS[b[0]] + BYTE_TO_BITS[b[1]] + BYTE_TO_BITS[b[2]] + BYTE_TO_BITS[b[3]]
+    return _legacy_signed_int_to_binary_str(x)
+
+
+def signed_int_to_byte_strs(x: int) -> list[str]:
+    """Split the encoding of `x` into the per-byte strings stored in memory."""
+    if LOWER_BOUND <= x < BIAS:
+        return [BYTE_TO_BITS[b] for b in (x & WORD_MASK).to_bytes(WORD_LEN, "big")]
+    bits = _legacy_signed_int_to_binary_str(x)
+    return [bits[s] for s in _WORD_SLICES]
+
+
+def byte_strs_to_signed_int(byte_strs: Sequence[str], address: int) -> int:
+    """Decode the big-endian word at `address` of a list of byte strings."""
+    if address >= 0:
+        try:
+            val = (
+                BITS_TO_BYTE[byte_strs[address]] << 24
+                | BITS_TO_BYTE[byte_strs[address + 1]] << 16
+                | BITS_TO_BYTE[byte_strs[address + 2]] << 8
+                | BITS_TO_BYTE[byte_strs[address + 3]]
+            )
+            return (val - BIAS) if (val > UPPER_BOUND) else val
+        except (IndexError, KeyError):
+            pass
+    return signed_binary_str_to_int(''.join(byte_strs[address:address + WORD_LEN]))
+
+
+def signed_ints_to_binary_block(values: Sequence[int]) -> str:
+    """Encode `values` as newline-terminated 32-bit lines in a single string.
+
+    Equivalent to joining `signed_int_to_binary_str(v) + "\n"` for each value.
+    """
+    if values and (min(values) < LOWER_BOUND or max(values) >= BIAS):
+        return "".join(f"{signed_int_to_binary_str(v)}\n" for v in values)
+    return "".join([format(v & WORD_MASK, _WORD_FORMAT) + "\n" for v in values])
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 class PerformanceTracker:
     """Collects simple performance statistics during execution.
@@ -14,6 +15,10 @@ class PerformanceTracker:
     def reset(self) -> None:
         self.total_instr = 0
         self.total_cycles = 0
+        # optional (label, count, cycles) rows appended to the report
+        self.breakdown: list[tuple[str, int, int]] = []
+        # set when the run was cut short (watchdog, cycle budget)
+        self.status: Optional[str] = None
 
     def update_cycle(self, num_cycles: int = 1) -> None:
         self.total_cycles += num_cycles
@@ -22,10 +27,11 @@ class PerformanceTracker:
         self.total_instr += num_instr
 
     def ipc(self) -> float:
-        return self.total_instr / self.total_cycles
+        # runs stopped before their first step have nothing to divide
+        return self.total_instr / self.total_cycles if self.total_cycles else 0.0
 
     def cpi(self) -> float:
-        return self.total_cycles / self.total_instr
+        return self.total_cycles / self.total_instr if self.total_instr else 0.0
 
     def write_performance(self, mode: str = "w") -> None:
         with self.outputFile.open(mode) as f:
@@ -37,6 +43,12 @@ class PerformanceTracker:
             f.write(f"#Instructions -> {self.total_instr}\n")
             f.write(f"CPI -> {self.cpi()}\n")
             f.write(f"IPC -> {self.ipc()}\n")
+            if self.status is not None:
+                f.write(f"Status -> {self.status}\n")
+            if self.breakdown:
+                f.write("Cycle breakdown:\n")
+                for label, count, cycles in self.breakdown:
+                    f.write(f"{label} -> {count} x, {cycles} cycles\n")
 
     def writePerformance(self, mode: str = "w") -> None:  # type: ignore[N802]
         return self.write_performance(mode)
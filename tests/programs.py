@@ -0,0 +1,59 @@
+"""Tiny RV32I encoder for building test programs as imem bitstrings."""
+from pathlib import Path
+
+HALT = "1" * 32
+
+
+def _bits(value: int, width: int) -> str:
+    return format(value & ((1 << width) - 1), f"0{width}b")
+
+
+def _r(rd: int, rs1: int, rs2: int, funct7: str = "0000000") -> str:
+    return funct7 + _bits(rs2, 5) + _bits(rs1, 5) + "000" + _bits(rd, 5) + "0110011"
+
+
+def add(rd: int, rs1: int, rs2: int) -> str:
+    return _r(rd, rs1, rs2)
+
+
+def sub(rd: int, rs1: int, rs2: int) -> str:
+    return _r(rd, rs1, rs2, "0100000")
+
+
+def addi(rd: int, rs1: int, imm: int) -> str:
+    return _bits(imm, 12) + _bits(rs1, 5) + "000" + _bits(rd, 5) + "0010011"
+
+
+def lw(rd: int, rs1: int, imm: int) -> str:
+    return _bits(imm, 12) + _bits(rs1, 5) + "010" + _bits(rd, 5) + "0000011"
+
+
+def sw(rs2: int, rs1: int, imm: int) -> str:
+    bits = _bits(imm, 12)
+    return bits[:7] + _bits(rs2, 5) + _bits(rs1, 5) + "010" + bits[7:] + "0100011"
+
+
+def _branch(rs1: int, rs2: int, imm: int, funct3: str) -> str:
+    bits = _bits(imm, 13)
+    return bits[0] + bits[2:8] + _bits(rs2, 5) + _bits(rs1, 5) + funct3 + bits[8:12] + bits[1] + "1100011"
+
+
+def beq(rs1: int, rs2: int, imm: int) -> str:
+    return _branch(rs1, rs2, imm, "000")
+
+
+def bne(rs1: int, rs2: int, imm: int) -> str:
+    return _branch(rs1, rs2, imm, "001")
+
+
+def jal(rd: int, imm: int) -> str:
+    bits = _bits(imm, 21)
+    return bits[0] + bits[10:20] + bits[9] + bits[1:9] + _bits(rd, 5) + "1101111"
+
+
+def write_case(case_dir: Path, program: list[str], data: tuple[int, ...] = ()) -> None:
+    """Write `imem.txt`/`dmem.txt` for `program`; `data` fills the first words of memory."""
+    case_dir.mkdir(parents=True, exist_ok=True)
+    (case_dir / "imem.txt").write_text("".join(w[i:i + 8] + "\n" for w in program for i in range(0, 32, 8)))
+    data_words = [_bits(v, 32) for v in data] + ["0" * 32] * 8
+    (case_dir / "dmem.txt").write_text("".join(w[i:i + 8] + "\n" for w in data_words for i in range(0, 32, 8)))
@@ -0,0 +1,105 @@
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from core import FUSION_HOT_THRESHOLD, FusedCore, get_engine
+from mem import DataMem, InsMem
+from programs import HALT, add, addi, beq, bne, jal, lw, sub, sw, write_case
+from timing import TimingModel
+
+ITERATIONS = FUSION_HOT_THRESHOLD + 36
+
+PROGRAMS = {
+    # seeded (LOAD_I, R, S) triple and (I, B) pair in a loop
+    "seeded": [
+        addi(1, 0, 12),
+        lw(2, 0, 0),        # loop:
+        add(3, 2, 1),
+        sw(3, 0, 4),
+        addi(1, 1, -1),
+        bne(1, 0, -16),     # taken 11 times, then falls through
+        lw(4, 0, 4),
+        add(5, 4, 4),       # (LOAD_I, R) pair
+        add(6, 5, 3),
+        sw(6, 0, 8),        # (R, S) pair
+        HALT,
+    ],
+    # a non-seeded straight-line run that becomes hot and is promoted
+    "hot-run": [
+        addi(1, 0, ITERATIONS),
+        addi(5, 0, 1),
+        sub(1, 1, 5),       # loop:
+        addi(6, 6, 3),
+        add(7, 7, 6),
+        sub(8, 7, 1),
+        beq(1, 0, 8),       # taken once, on exit
+        jal(9, -20),
+        sw(8, 0, 12),
+        HALT,
+    ],
+    # jumps over dead code, taken and not-taken branches
+    "control-flow": [
+        lw(1, 0, 0),
+        jal(2, 8),
+        addi(3, 0, 99),     # skipped
+        beq(1, 0, 8),       # not taken
+        bne(1, 0, 8),       # taken
+        addi(3, 0, 77),     # skipped
+        sub(4, 0, 1),
+        sw(4, 0, 16),
+        jal(0, 4),
+        HALT,
+    ],
+}
+
+LATENCY_MODEL = TimingModel(
+    latency={"LOAD_I": 2, "S": 2},
+    alu={"SUB": 1},
+    penalty={"branch_taken": 2, "jump": 1, "load": 1},
+)
+
+
+def _run(engine: str, case_dir: Path, out_dir: Path, timing: Optional[TimingModel], max_cycles: Optional[int]):
+    out_dir.mkdir()
+    dmem = DataMem("Dmem", case_dir, out_dir)
+    core = get_engine(engine)(out_dir, InsMem("Imem", case_dir), dmem, timing)
+    core.per_cycle_dumps = False
+    halted = core.run(max_cycles)
+    result = {
+        "halted": halted,
+        "pc": core.pc,
+        "registers": list(core.myRF.Registers),
+        "data_bytes": list(dmem.data_bytes),
+        "total_cycles": core.monitor.total_cycles,
+        "total_instr": core.monitor.total_instr,
+        "breakdown": core.cycle_breakdown(),
+    }
+    return core, result
+
+
+@pytest.mark.parametrize("max_cycles", [None, 1, 5, 17, 50, 100])
+@pytest.mark.parametrize("timing", [None, LATENCY_MODEL], ids=["unit", "latency-model"])
+@pytest.mark.parametrize("name", sorted(PROGRAMS))
+def test_fused_matches_single_stage(tmp_path: Path, name: str, timing: Optional[TimingModel],
+                                    max_cycles: Optional[int]) -> None:
+    write_case(tmp_path / "in", PROGRAMS[name], data=(7, 3))
+    _, expected = _run("single-stage", tmp_path / "in", tmp_path / "single", timing, max_cycles)
+    fused, actual = _run("fused", tmp_path / "in", tmp_path / "fused", timing, max_cycles)
+
+    assert actual == expected
+    assert isinstance(fused, FusedCore)
+    if max_cycles is None:
+        assert expected["halted"]
+        # blocks are built on dispatch, so this proves a fused block ran
+        assert any(blk.n > 1 for blk in fused.blocks.values())
+
+
+def test_hot_run_is_promoted(tmp_path: Path) -> None:
+    write_case(tmp_path / "in", PROGRAMS["hot-run"])
+    fused, result = _run("fused", tmp_path / "in", tmp_path / "fused", None, None)
+
+    assert result["halted"]
+    loop_head = 8
+    assert fused.blocks[loop_head].n > 1
+    assert result["registers"][1] == 0
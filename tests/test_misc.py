@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from constants import BIAS, BYTE_LEN, UPPER_BOUND, WORD_LEN
+from misc import (LOWER_BOUND, _legacy_signed_int_to_binary_str, byte_strs_to_signed_int, signed_binary_str_to_int,
+                  signed_int_to_binary_str, signed_int_to_byte_strs, signed_ints_to_binary_block)
+
+EDGES = [
+    0, 1, -1, UPPER_BOUND, UPPER_BOUND + 1, LOWER_BOUND, LOWER_BOUND + 1, LOWER_BOUND - 1,
+    BIAS - 1, BIAS, BIAS + 1, 2 * BIAS + 5, -BIAS, -BIAS - 1, -2 * BIAS - 7, 1 << 40, -(1 << 40),
+]
+VALUES = EDGES + [random.Random(0).randrange(-(1 << 34), 1 << 34) for _ in range(20000)]
+
+
+def _legacy_byte_strs(x: int) -> list[str]:
+    bits = _legacy_signed_int_to_binary_str(x)
+    return [bits[BYTE_LEN * i:BYTE_LEN * (i + 1)] for i in range(WORD_LEN)]
+
+
+def _outcome(fn, *args):
+    try:
+        return fn(*args)
+    except Exception as exc:
+        return type(exc)
+
+
+def test_encoding_matches_legacy() -> None:
+    for x in VALUES:
+        assert signed_int_to_binary_str(x) == _legacy_signed_int_to_binary_str(x), x
+        assert signed_int_to_byte_strs(x) == _legacy_byte_strs(x), x
+
+
+def test_block_matches_legacy() -> None:
+    assert signed_ints_to_binary_block([]) == ""
+    for values in ([0] * 32, VALUES[:32], EDGES, VALUES[-32:]):
+        expected = "".join(_legacy_signed_int_to_binary_str(v) + "\n" for v in values)
+        assert signed_ints_to_binary_block(values) == expected
+
+
+@pytest.mark.parametrize("x", EDGES)
+def test_decoding_round_trips_in_range_values(x: int) -> None:
+    memory = ["00000000"] * 4 + signed_int_to_byte_strs(x)
+    legacy = signed_binary_str_to_int("".join(memory[4:8]))
+    assert byte_strs_to_signed_int(memory, 4) == legacy
+
+
+@pytest.mark.parametrize("address", [-8, -4, -1, 0, 1, 2, 4, 6, 8, 12])
+def test_decoding_matches_legacy_on_irregular_memory(address: int) -> None:
+    # entries a store of an out-of-range value can leave behind, plus a short tail
+    memory = ["11111111", "1", "0000000010", "", "10000000", "00000000", "-101", "01", "00000001", "10101010"]
+    legacy = _outcome(lambda: signed_binary_str_to_int("".join(memory[address:address + WORD_LEN])))
+    assert _outcome(byte_strs_to_signed_int, memory, address) == legacy
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import pytest
+
+from core import get_engine
+from mem import DataMem, InsMem
+from programs import HALT, add, addi, beq, sw, write_case
+from watchdog import Watchdog
+
+
+@pytest.mark.parametrize("engine", ["single-stage", "fused"])
+def test_watchdog_stops_infinite_loop(tmp_path: Path, engine: str) -> None:
+    # (addi; add; sw; addi; beq back) forever; fused dispatch advances 2-3 cycles per step
+    program = [addi(1, 0, 5), add(2, 1, 0), sw(2, 0, 0), addi(3, 0, 1), beq(0, 0, -16), HALT]
+    write_case(tmp_path / "in", program)
+    core = get_engine(engine)(tmp_path, InsMem("Imem", tmp_path / "in"), DataMem("Dmem", tmp_path / "in", tmp_path))
+    core.per_cycle_dumps = False
+    watchdog = Watchdog()
+    watchdog.attach(core)
+
+    assert core.run(max_cycles=10_000)
+    assert watchdog.status is not None
+    assert core.monitor.total_cycles < 10_000
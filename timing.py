@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+from typing import Optional
+
+from alu import ALU_OPs
+from constants import INSTR_TYPES
+
+# reverse lookup so configs can name ALU ops (ADD, SUB, XOR, OR, AND)
+ALU_OP_NAMES = {fn: name for name, fn in vars(ALU_OPs).items()}
+
+# instruction classes that actually go through the EX stage
+ALU_TYPES = (INSTR_TYPES.R, INSTR_TYPES.I, INSTR_TYPES.LOAD_I, INSTR_TYPES.S)
+
+PENALTY_KEYS = ("branch_taken", "jump", "load")
+
+
+class TimingModel(object):
+    """Per-instruction-class latency model used for cycle accounting.
+
+    The default instance charges one cycle per instruction, matching the
+    plain single-stage core. Static costs are resolved once per decoded
+    instruction by `latency_of`; only the taken-branch penalty is dynamic.
+
+    Config files (TOML or JSON) may contain the tables `latency`
+    (class name -> cycles), `alu` (op name -> extra cycles) and `penalty`
+    (`branch_taken`, `jump`, `load` -> extra cycles).
+    """
+
+    def __init__(
+        self,
+        latency: Optional[dict] = None,
+        alu: Optional[dict] = None,
+        penalty: Optional[dict] = None,
+    ) -> None:
+        self.latency: dict[INSTR_TYPES, int] = {t: 1 for t in INSTR_TYPES}
+        self.alu_extra: dict[str, int] = {name: 0 for name in vars(ALU_OPs)}
+        self.penalty: dict[str, int] = {key: 0 for key in PENALTY_KEYS}
+
+        for name, cycles in (latency or {}).items():
+            if name not in INSTR_TYPES.__members__:
+                raise ValueError(f"Unknown instruction class in timing model: {name}")
+            self.latency[INSTR_TYPES[name]] = int(cycles)
+        for name, cycles in (alu or {}).items():
+            if name not in self.alu_extra:
+                raise ValueError(f"Unknown ALU op in timing model: {name}")
+            self.alu_extra[name] = int(cycles)
+        for name, cycles in (penalty or {}).items():
+            if name not in self.penalty:
+                raise ValueError(f"Unknown penalty in timing model: {name}")
+            self.penalty[name] = int(cycles)
+
+        self.branch_taken_penalty = self.penalty["branch_taken"]
+
+    @classmethod
+    def from_file(cls, path: Path) -> "TimingModel":
+        if path.suffix == ".toml":
+            # tomllib is only in the standard library from Python 3.11
+            try:
+                import tomllib
+            except ModuleNotFoundError:
+                try:
+                    import tomli as tomllib
+                except ModuleNotFoundError:
+                    raise ValueError(
+                        f"Reading {path} needs Python 3.11+ or the 'tomli' package; use a JSON config instead"
+                    ) from None
+            with open(path, "rb") as fh:
+                cfg = tomllib.load(fh)
+        else:
+            with open(path) as fh:
+                cfg = json.load(fh)
+        unknown = set(cfg) - {"latency", "alu", "penalty"}
+        if unknown:
+            raise ValueError(f"Unknown timing model section(s): {', '.join(sorted(unknown))}")
+        return cls(cfg.get("latency"), cfg.get("alu"), cfg.get("penalty"))
+
+    def latency_of(self, instr) -> int:
+        """Static cycle cost of a decoded instruction (excluding taken branches)."""
+        cycles = self.latency[instr.type]
+        if instr.type in ALU_TYPES:
+            cycles += self.alu_extra[ALU_OP_NAMES[instr.alu_op]]
+        if instr.type == INSTR_TYPES.LOAD_I:
+            cycles += self.penalty["load"]
+        elif instr.type == INSTR_TYPES.J:
+            cycles += self.penalty["jump"]
+        return cycles
+
+
+UNIT_TIMING = TimingModel()
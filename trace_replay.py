@@ -0,0 +1,170 @@
+"""Offline analysis of data-memory traces written with `main.py --mem-trace`.
+
+The trace is memory-mapped and processed in fixed-size chunks, so files with
+hundreds of millions of records never have to fit in RAM. Requires NumPy.
+
+    python trace_replay.py output_bk3170/<case>/MemTrace.bin --window 10000
+"""
+import argparse
+import json
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from memtrace import MEM_WRITE, MEMTRACE_MAGIC, MEMTRACE_RECORD
+
+# packed mirror of `memtrace.MEMTRACE_RECORD`
+TRACE_DTYPE = np.dtype([("cycle", "<u8"), ("pc", "<u4"), ("addr", "<u4"), ("rw", "u1")])
+assert TRACE_DTYPE.itemsize == MEMTRACE_RECORD.size
+
+DEFAULT_CHUNK = 1 << 24
+DEFAULT_WINDOW = 10000
+
+
+def load_trace(path: Path) -> np.ndarray:
+    """Memory-map a trace file as a structured array of `TRACE_DTYPE`."""
+    with open(path, "rb") as fh:
+        if fh.read(len(MEMTRACE_MAGIC)) != MEMTRACE_MAGIC:
+            raise ValueError(f"{path} is not a memory trace file")
+    if path.stat().st_size == len(MEMTRACE_MAGIC):
+        return np.zeros(0, dtype=TRACE_DTYPE)
+    return np.memmap(path, dtype=TRACE_DTYPE, mode="r", offset=len(MEMTRACE_MAGIC))
+
+
+def _empty_carry() -> tuple[np.ndarray, np.ndarray]:
+    return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+
+def _grouped_deltas(keys: np.ndarray, values: np.ndarray, carry):
+    """Differences between successive `values` that share a key.
+
+    `carry` holds (sorted keys, last value) from earlier chunks so deltas
+    spanning a chunk boundary are not lost. Returns the deltas, the number
+    of keys never seen before, and the updated carry.
+    """
+    order = np.argsort(keys, kind="stable")
+    k, v = keys[order], values[order]
+    same = k[1:] == k[:-1]
+    inner = v[1:][same] - v[:-1][same]
+
+    first = np.r_[True, ~same]
+    fk, fv = k[first], v[first]
+    ck, cv = carry
+    pos = np.searchsorted(ck, fk)
+    hit = np.zeros(len(fk), dtype=bool)
+    if len(ck):
+        in_range = pos < len(ck)
+        hit[in_range] = ck[pos[in_range]] == fk[in_range]
+    across = fv[hit] - cv[pos[hit]]
+
+    last = np.r_[~same, True]
+    lk, lv = k[last], v[last]
+    keep = ~np.isin(ck, lk)
+    nk = np.concatenate([ck[keep], lk])
+    nv = np.concatenate([cv[keep], lv])
+    o = np.argsort(nk)
+    return np.concatenate([inner, across]), int((~hit).sum()), (nk[o], nv[o])
+
+
+def _add_counts(counter: Counter, values: np.ndarray) -> None:
+    uniq, counts = np.unique(values, return_counts=True)
+    counter.update(dict(zip(uniq.tolist(), counts.tolist())))
+
+
+def analyze(trace: np.ndarray, window: int = DEFAULT_WINDOW, chunk: int = DEFAULT_CHUNK) -> dict:
+    """Compute reuse-time, working-set and stride statistics of a trace.
+
+    Reuse time is the number of accesses between two touches of the same
+    address (not the number of distinct addresses, i.e. stack distance),
+    bucketed by powers of two. The working set is the number of distinct
+    addresses in each window of `window` accesses.
+    """
+    chunk = max(window, chunk - chunk % window)
+    total = len(trace)
+
+    reuse_buckets = np.zeros(65, dtype=np.int64)
+    cold = 0
+    reuse_carry = _empty_carry()
+    pc_carry = _empty_carry()
+    global_strides: Counter = Counter()
+    pc_strides: Counter = Counter()
+    working_set = []
+    writes = 0
+    prev_addr = None
+
+    for start in range(0, total, chunk):
+        part = trace[start:start + chunk]
+        addr = part["addr"].astype(np.int64)
+        pc = part["pc"].astype(np.int64)
+        idx = np.arange(start, start + len(part), dtype=np.int64)
+        writes += int(np.count_nonzero(part["rw"] == MEM_WRITE))
+
+        gaps, new, reuse_carry = _grouped_deltas(addr, idx, reuse_carry)
+        cold += new
+        buckets = np.floor(np.log2(gaps)).astype(np.int64)
+        reuse_buckets += np.bincount(buckets, minlength=len(reuse_buckets))[:len(reuse_buckets)]
+
+        strides = np.diff(addr) if prev_addr is None else np.diff(np.r_[prev_addr, addr])
+        prev_addr = addr[-1]
+        _add_counts(global_strides, strides)
+        strides, _, pc_carry = _grouped_deltas(pc, addr, pc_carry)
+        _add_counts(pc_strides, strides)
+
+        win = (idx - start) // window
+        keys = np.unique(win << 32 | addr)
+        working_set.append(np.bincount(keys >> 32, minlength=int(win[-1]) + 1))
+
+    last_bucket = int(np.flatnonzero(reuse_buckets).max()) + 1 if reuse_buckets.any() else 0
+    ws = np.concatenate(working_set) if working_set else np.zeros(0, dtype=np.int64)
+    return {
+        "accesses": total,
+        "reads": total - writes,
+        "writes": writes,
+        "distinct_addresses": len(reuse_carry[0]),
+        "reuse_time": {
+            "cold": cold,
+            # bucket k counts reuses with 2**k - 1 <= time < 2**(k+1) - 1
+            "log2_buckets": reuse_buckets[:last_bucket].tolist(),
+        },
+        "working_set": {
+            "window": window,
+            "mean": float(ws.mean()) if len(ws) else 0.0,
+            "max": int(ws.max()) if len(ws) else 0,
+            "per_window": ws.tolist(),
+        },
+        "strides": {
+            "global": dict(global_strides.most_common()),
+            "per_pc": dict(pc_strides.most_common()),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Analyze a binary data-memory trace")
+    parser.add_argument("trace", type=Path, help="Trace file written by --mem-trace")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="Accesses per working-set window")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="Records processed per chunk")
+    parser.add_argument("--json", type=Path, default=None, help="Write the full report to this file")
+    ns = parser.parse_args()
+
+    report = analyze(load_trace(ns.trace), window=ns.window, chunk=ns.chunk)
+    if ns.json is not None:
+        with open(ns.json, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+    print(f"Accesses -> {report['accesses']} ({report['reads']} R / {report['writes']} W)")
+    print(f"Distinct addresses -> {report['distinct_addresses']}")
+    print(f"Cold misses -> {report['reuse_time']['cold']}")
+    for k, n in enumerate(report["reuse_time"]["log2_buckets"]):
+        if n:
+            print(f"Reuse time [{2 ** k - 1}, {2 ** (k + 1) - 1}) -> {n}")
+    ws = report["working_set"]
+    print(f"Working set per {ws['window']} accesses -> mean {ws['mean']:.2f}, max {ws['max']}")
+    for name, hist in report["strides"].items():
+        top = ", ".join(f"{s}: {n}" for s, n in list(hist.items())[:8])
+        print(f"Top strides ({name}) -> {top}")
+
+
+if __name__ == "__main__":
+    main()
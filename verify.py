@@ -0,0 +1,183 @@
+"""Compare simulator outputs against golden outputs, case by case.
+
+Files are streamed in large chunks and compared byte-wise, one case per
+worker process. Only when a chunk differs is the file re-scanned to turn
+the byte offset into a cycle/register, memory address or line number.
+
+    python verify.py output_bk3170 golden/ --jobs 8 --json summary.json
+"""
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from constants import DMEM_RESULT_FILE, RF_FILE
+
+CHUNK_SIZE = 1 << 23
+CYCLE_MARKER = b"after executing cycle: "
+
+
+def _first_difference(a: bytes, b: bytes) -> int:
+    """Index of the first differing byte of two unequal buffers."""
+    ma, mb = memoryview(a), memoryview(b)
+    lo, hi = 0, min(len(a), len(b))
+    # bisect on slice equality (C speed) before the final short scan
+    while hi - lo > 64:
+        mid = (lo + hi) // 2
+        if ma[lo:mid] == mb[lo:mid]:
+            lo = mid
+        else:
+            hi = mid
+    for i in range(lo, hi):
+        if a[i] != b[i]:
+            return i
+    return hi
+
+
+def first_mismatch(expected: Path, actual: Path, chunk_size: int = CHUNK_SIZE) -> Optional[int]:
+    """Byte offset of the first difference between two files, or None."""
+    offset = 0
+    with open(expected, "rb") as fe, open(actual, "rb") as fa:
+        while True:
+            ce = fe.read(chunk_size)
+            ca = fa.read(chunk_size)
+            if ce != ca:
+                return offset + _first_difference(ce, ca)
+            if not ce:
+                return None
+            offset += len(ce)
+
+
+def locate(path: Path, offset: int, chunk_size: int = CHUNK_SIZE) -> tuple[int, int, Optional[int], int]:
+    """Map `offset` to (line index, line start, last cycle header, lines since that header)."""
+    line_no = 0
+    line_start = 0
+    cycle = None
+    header_line = 0
+    remaining = offset
+    carry = b""
+    with open(path, "rb") as fh:
+        while remaining > 0:
+            data = fh.read(min(chunk_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            # only scan complete lines so headers never straddle two reads
+            data = carry + data
+            nl = data.rfind(b"\n")
+            if nl < 0:
+                carry = data
+                continue
+            complete, carry = data[:nl + 1], data[nl + 1:]
+            marker = complete.rfind(CYCLE_MARKER)
+            if marker >= 0:
+                end = complete.find(b"\n", marker)
+                try:
+                    cycle = int(complete[marker + len(CYCLE_MARKER):end])
+                    header_line = line_no + complete.count(b"\n", 0, end)
+                except ValueError:
+                    pass
+            line_no += complete.count(b"\n")
+            line_start += len(complete)
+    return line_no, line_start, cycle, line_no - header_line
+
+
+def read_line(path: Path, start: int) -> Optional[str]:
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        line = fh.readline()
+    return line.rstrip(b"\n").decode(errors="replace") if line else None
+
+
+def describe_mismatch(name: str, expected: Path, actual: Path, offset: int) -> dict:
+    """Explain a mismatch in terms of the file's layout."""
+    line_no, line_start, cycle, since_header = locate(expected, offset)
+    report = {
+        "offset": offset,
+        "line": line_no + 1,
+        "expected": read_line(expected, line_start),
+        "actual": read_line(actual, line_start),
+    }
+    if cycle is not None:
+        report["cycle"] = cycle
+        # RF dumps list x0..x31 on the lines following the cycle header
+        if name.endswith(RF_FILE) and 1 <= since_header <= 32:
+            report["register"] = since_header - 1
+    if name.endswith(DMEM_RESULT_FILE):
+        report["address"] = line_no
+    return report
+
+
+def verify_case(expected_dir: Path, actual_dir: Path) -> dict:
+    """Compare every golden file of one case; extra output files are ignored."""
+    files = {}
+    for expected in sorted(p for p in expected_dir.iterdir() if p.is_file()):
+        actual = actual_dir / expected.name
+        if not actual.is_file():
+            files[expected.name] = {"status": "missing"}
+            continue
+        offset = first_mismatch(expected, actual)
+        if offset is None:
+            files[expected.name] = {"status": "pass"}
+        else:
+            files[expected.name] = {"status": "fail", **describe_mismatch(expected.name, expected, actual, offset)}
+    passed = all(f["status"] == "pass" for f in files.values())
+    return {"case": expected_dir.name, "status": "pass" if passed else "fail", "files": files}
+
+
+def _verify_pair(pair: tuple[Path, Path]) -> dict:
+    return verify_case(*pair)
+
+
+def verify_all(output_dir: Path, golden_dir: Path, jobs: Optional[int] = None) -> dict:
+    cases = sorted(p for p in golden_dir.iterdir() if p.is_dir() and not p.name.startswith("."))
+    pairs = [(case, output_dir / case.name) for case in cases]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(_verify_pair, pairs))
+    failed = [r["case"] for r in results if r["status"] != "pass"]
+    return {
+        "cases": len(results),
+        "passed": len(results) - len(failed),
+        "failed": failed,
+        "results": {r["case"]: r for r in results},
+    }
+
+
+def format_failure(name: str, info: dict) -> str:
+    if info["status"] == "missing":
+        return f"{name}: missing"
+    where = [f"line {info['line']}"]
+    if "cycle" in info:
+        where.append(f"cycle {info['cycle']}")
+    if "register" in info:
+        where.append(f"x{info['register']}")
+    if "address" in info:
+        where.append(f"byte {info['address']}")
+    return f"{name}: {', '.join(where)}: expected {info['expected']!r}, got {info['actual']!r}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Verify simulator outputs against golden outputs")
+    parser.add_argument("output_dir", type=Path, help="Folder holding one output folder per case")
+    parser.add_argument("golden_dir", type=Path, help="Folder holding one golden folder per case")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--json", type=Path, default=None, help="Write the summary to this file")
+    ns = parser.parse_args()
+
+    summary = verify_all(ns.output_dir.resolve(), ns.golden_dir.resolve(), ns.jobs)
+    if ns.json is not None:
+        with open(ns.json, "w") as fh:
+            json.dump(summary, fh, indent=2)
+
+    for case in summary["failed"]:
+        print(f"❌ {case}")
+        for name, info in summary["results"][case]["files"].items():
+            if info["status"] != "pass":
+                print(f"   {format_failure(name, info)}")
+    print(f"{summary['passed']}/{summary['cases']} cases match")
+    raise SystemExit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from typing import Callable, Optional
+
+from constants import WORD_LEN
+
+
+class Watchdog(object):
+    """Stops cores that can never reach HALT.
+
+    An incremental hash of registers and data memory is updated only when a
+    write actually changes a value. After each step the (PC, hash) pair is
+    compared with a checkpoint taken at power-of-two step intervals (Brent's
+    cycle detection), so memory stays constant however long the run is. A
+    hash hit is confirmed against an exact snapshot of the checkpoint state;
+    since the core is deterministic, an identical full state proves a loop.
+    """
+
+    def __init__(self) -> None:
+        self.core = None
+        self.state_hash = 0
+        self.status: Optional[str] = None
+        self.checkpoint = None
+        self.checkpoint_cycle = 0
+        self.checkpoint_total_cycles = 0
+        self.power = 1
+
+    def attach(self, core) -> None:
+        self.core = core
+        rf = core.myRF
+        dmem = core.ext_dmem
+        rf.write_reg = self._wrap_write_reg(rf.read_reg, rf.write_reg)
+        dmem.store_word = self._wrap_store(dmem.data_bytes, dmem.store_word)
+        core.step = self._wrap_step(core.step)
+        self._take_checkpoint()
+
+    def _wrap_write_reg(self, read_reg: Callable, write_reg: Callable) -> Callable:
+        def watched_write_reg(reg_addr: int, wrt_reg_data: int) -> None:
+            old = read_reg(reg_addr)
+            write_reg(reg_addr, wrt_reg_data)
+            if old != wrt_reg_data:
+                self.state_hash ^= hash(("x", reg_addr, old)) ^ hash(("x", reg_addr, wrt_reg_data))
+        return watched_write_reg
+
+    def _wrap_store(self, data_bytes: list, store_word: Callable) -> Callable:
+        def watched_store_word(address: int, write_data: int) -> None:
+            old = data_bytes[address:address + WORD_LEN]
+            store_word(address, write_data)
+            new = data_bytes[address:address + WORD_LEN]
+            if old != new:
+                for addr, before, after in zip(range(address, address + WORD_LEN), old, new):
+                    if before != after:
+                        self.state_hash ^= hash(("m", addr, before)) ^ hash(("m", addr, after))
+        return watched_store_word
+
+    def _snapshot(self) -> tuple:
+        core = self.core
+        return core.pc, self.state_hash, list(core.myRF.Registers), list(core.ext_dmem.data_bytes)
+
+    def _take_checkpoint(self) -> None:
+        self.checkpoint = self._snapshot()
+        self.checkpoint_cycle = self.core.cycle
+        self.checkpoint_total_cycles = self.core.monitor.total_cycles
+
+    def _wrap_step(self, step: Callable) -> Callable:
+        def watched_step() -> None:
+            step()
+            core = self.core
+            pc, state_hash = self.checkpoint[0], self.checkpoint[1]
+            # a pending HALT leaves PC and state untouched for one step
+            if core.pc == pc and self.state_hash == state_hash and not (core.halted or core.nextState.IF['nop']):
+                if self._snapshot() == self.checkpoint:
+                    # report charged cycles, the unit of #Cycles and --max-cycles
+                    self.status = (
+                        f"stopped, no progress: state at cycle {core.monitor.total_cycles} "
+                        f"repeats the state at cycle {self.checkpoint_total_cycles}"
+                    )
+                    core.halted = True
+                    return
+            # fusing engines advance several cycles per step, so never test for equality
+            if core.cycle - self.checkpoint_cycle >= self.power:
+                self.power *= 2
+                self._take_checkpoint()
+        return watched_step